@@ -5,9 +5,12 @@ This module provides centralized configuration management for all components.
 """
 
 import os
+import stat
 import logging
+import functools
+import itertools
 from pathlib import Path
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Iterator, Optional, Tuple
 from dataclasses import dataclass, field
 
 
@@ -24,7 +27,9 @@ class ParserConfig:
     """Configuration for document parsing."""
     min_paragraph_length: int = 20
     encoding: str = "utf-8"
-    ignored_labels: list = field(default_factory=lambda: ["equation", "figure"])
+    # Informational only: the page parser does not read this setting and
+    # uses its own parser.IGNORED_LABELS, so changing it has no effect there
+    ignored_labels: frozenset[str] = frozenset({"equation", "figure"})
     
 
 @dataclass
@@ -57,6 +62,9 @@ class AppConfig:
     retriever: RetrieverConfig = field(default_factory=RetrieverConfig)
     vectordb: VectorDBConfig = field(default_factory=VectorDBConfig)
     data: DataConfig = field(default_factory=DataConfig)
+    _applied_logging_signature: Optional[Tuple[str, str, Optional[str]]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
     
     @classmethod
     def from_env(cls) -> 'AppConfig':
@@ -97,7 +105,17 @@ class AppConfig:
         return config
     
     def setup_logging(self) -> None:
-        """Setup logging based on configuration."""
+        """
+        Setup logging based on configuration.
+
+        Does nothing if the same logging settings were already applied by
+        this instance, so repeated notebook setup calls don't rebuild the
+        root logger handlers.
+        """
+        signature = (self.logging.level, self.logging.format, self.logging.file_path)
+        if signature == self._applied_logging_signature:
+            return
+        
         log_level = getattr(logging, self.logging.level.upper(), logging.INFO)
         
         handlers = [logging.StreamHandler()]
@@ -114,29 +132,46 @@ class AppConfig:
             force=True  # Override any existing configuration
         )
         
+        self._applied_logging_signature = signature
         logging.info("Logging configured successfully")
     
-    def validate(self) -> bool:
-        """Validate configuration values."""
-        errors = []
-        
+    def _iter_validation_errors(self) -> Iterator[str]:
+        """Yield configuration errors one at a time."""
         # Validate parser config
         if self.parser.min_paragraph_length < 0:
-            errors.append("min_paragraph_length must be non-negative")
+            yield "min_paragraph_length must be non-negative"
             
         # Validate retriever config
         if self.retriever.default_k <= 0:
-            errors.append("default_k must be positive")
+            yield "default_k must be positive"
             
         if self.retriever.max_k <= 0:
-            errors.append("max_k must be positive")
+            yield "max_k must be positive"
             
         if self.retriever.default_k > self.retriever.max_k:
-            errors.append("default_k cannot be greater than max_k")
+            yield "default_k cannot be greater than max_k"
         
         # Validate paths
-        if self.data.json_data_dir and not Path(self.data.json_data_dir).exists():
-            errors.append(f"JSON data directory does not exist: {self.data.json_data_dir}")
+        if self.data.json_data_dir:
+            try:
+                is_dir = stat.S_ISDIR(os.stat(self.data.json_data_dir).st_mode)
+            except FileNotFoundError:
+                yield f"JSON data directory does not exist: {self.data.json_data_dir}"
+            except OSError as e:
+                yield f"JSON data directory is not accessible: {self.data.json_data_dir} ({e.strerror})"
+            else:
+                if not is_dir:
+                    yield f"JSON data path is not a directory: {self.data.json_data_dir}"
+    
+    def validate(self, fail_fast: bool = False) -> bool:
+        """
+        Validate configuration values.
+
+        Args:
+            fail_fast: Stop at the first error instead of reporting all of them.
+        """
+        errors = self._iter_validation_errors()
+        errors = list(itertools.islice(errors, 1)) if fail_fast else list(errors)
         
         if errors:
             for error in errors:
@@ -147,18 +182,20 @@ class AppConfig:
         return True
 
 
-# Global configuration instance
-config = AppConfig.from_env()
-
-
+@functools.cache
 def get_config() -> AppConfig:
-    """Get the global configuration instance."""
-    return config
+    """
+    Get the global configuration instance.
+
+    The configuration is built from the environment on first call and
+    cached, so importing this module does no environment or filesystem work.
+    """
+    return AppConfig.from_env()
 
 
 def update_config(**kwargs) -> None:
     """Update global configuration with new values."""
-    global config
+    config = get_config()
     for key, value in kwargs.items():
         if hasattr(config, key):
             setattr(config, key, value)
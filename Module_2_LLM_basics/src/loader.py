@@ -1,7 +1,8 @@
 # src/loader.py
+import itertools
 import logging
 from pathlib import Path
-from typing import Iterator, List
+from typing import Iterator, List, Optional
 from langchain_core.documents import Document
 from langchain_core.document_loaders import BaseLoader
 from .parser import process_article  # Fixed relative import
@@ -15,18 +16,29 @@ class ArticleLoader(BaseLoader):
     Takes the path to a specific article *directory* containing JSON files
     and loads the processed text content and metadata.
     """
-    def __init__(self, file_path: str | Path) -> None:
+    def __init__(
+        self,
+        file_path: str | Path,
+        workers: Optional[int] = 1,
+        cache_dir: Optional[str | Path] = None
+    ) -> None:
         """
         Initializes the loader with the path to the article directory.
 
         Args:
             file_path: The path to the directory containing the article's JSON files.
+            workers: Number of worker processes used to parse pages.
+                1 (the default) parses pages serially, None uses all CPUs.
+            cache_dir: Optional directory where processed pages are cached
+                between runs (see parser.load_processed_page).
             
         Raises:
             ValueError: If the provided path is not a directory.
             FileNotFoundError: If the provided path does not exist.
         """
         self.file_path = Path(file_path)
+        self.workers = workers
+        self.cache_dir = Path(cache_dir).expanduser() if cache_dir is not None else None
         
         if not self.file_path.exists():
             raise FileNotFoundError(f"Provided path '{file_path}' does not exist.")
@@ -38,8 +50,8 @@ class ArticleLoader(BaseLoader):
         """
         Lazily loads documents from the specified article directory.
 
-        This method processes the article using the imported 'process_article'
-        function and yields Langchain Document objects one by one.
+        This method streams the article through the imported 'process_article'
+        generator and yields Langchain Document objects as pages are parsed.
         
         Yields:
             Document: Langchain Document objects with processed content and metadata.
@@ -48,14 +60,47 @@ class ArticleLoader(BaseLoader):
             Exception: If there's an error processing the article.
         """
         try:
-            processed_docs = process_article(self.file_path, min_length=0)
-            logger.info(f"Successfully processed {len(processed_docs)} documents from {self.file_path}")
-            
-            for doc_data in processed_docs:
+            count = 0
+            for doc_data in process_article(
+                self.file_path, min_length=0, workers=self.workers, cache_dir=self.cache_dir
+            ):
+                count += 1
                 yield Document(
                     page_content=doc_data["page_content"],
                     metadata=doc_data["metadata"]
                 )
+
+            logger.info(f"Successfully processed {count} documents from {self.file_path}")
         except Exception as e:
             logger.error(f"Error processing article from {self.file_path}: {str(e)}")
-            raise
\ No newline at end of file
+            raise
+
+    def load_batched(self, batch_size: int = 256) -> Iterator[List[Document]]:
+        """
+        Lazily loads documents in lists of up to batch_size.
+
+        Useful for bulk ingestion: each batch can be passed to a single
+        vector store call (e.g. Chroma.add_documents), which lets the
+        embedding model embed the whole batch in one request. Keep
+        batch_size within the embedding API's per-request input limit.
+
+        Args:
+            batch_size: Maximum number of documents per batch.
+
+        Returns:
+            Iterator[List[Document]]: Batches of Langchain Document objects.
+
+        Raises:
+            ValueError: If batch_size is not positive (raised by the call,
+                not on first iteration).
+        """
+        if batch_size <= 0:
+            raise ValueError("batch_size must be a positive integer")
+
+        return self._iter_batches(batch_size)
+
+    def _iter_batches(self, batch_size: int) -> Iterator[List[Document]]:
+        """Yields lists of up to batch_size documents from lazy_load."""
+        documents = self.lazy_load()
+        while batch := list(itertools.islice(documents, batch_size)):
+            yield batch
\ No newline at end of file
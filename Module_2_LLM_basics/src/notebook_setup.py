@@ -7,6 +7,8 @@ This module provides proper imports and configuration setup for Jupyter notebook
 import os
 import sys
 import logging
+import importlib
+from collections.abc import Iterator, MutableMapping
 from pathlib import Path
 from typing import Optional
 
@@ -46,15 +48,90 @@ def setup_notebook_environment():
         logging.info("Using fallback configuration")
         return None, project_root
 
-def get_safe_imports():
+LLM_MODEL_NAME = 'gpt-4o-mini'
+
+
+class LazyImports(MutableMapping):
     """
-    Get safe import statements for notebooks.
+    Dictionary of notebook variables whose heavy entries are built on first access.
+
+    Lazy entries are zero-argument factories; indexing the mapping calls the
+    factory once and stores the result, so `imports['llm']` behaves the same
+    as with an eagerly built dictionary. Keys, `in` and `len()` cover lazy
+    entries without building them, while reading values (`items()`,
+    `values()`, `{**imports}`, `globals().update(imports)`) builds them.
+    """
+
+    def __init__(self, values: Optional[dict] = None, factories: Optional[dict] = None):
+        self._values = dict(values or {})
+        self._factories = {
+            key: factory for key, factory in (factories or {}).items()
+            if key not in self._values
+        }
+
+    def __getitem__(self, key):
+        try:
+            return self._values[key]
+        except KeyError:
+            pass
+        if key not in self._factories:
+            raise KeyError(key)
+        # The factory is only dropped once it succeeds, so a failed build
+        # (e.g. a missing API key) can be retried
+        value = self._values[key] = self._factories[key]()
+        del self._factories[key]
+        return value
+
+    def __setitem__(self, key, value) -> None:
+        self._values[key] = value
+        self._factories.pop(key, None)
+
+    def __delitem__(self, key) -> None:
+        if key in self._values:
+            del self._values[key]
+        elif key in self._factories:
+            del self._factories[key]
+        else:
+            raise KeyError(key)
+
+    def __contains__(self, key) -> bool:
+        return key in self._values or key in self._factories
+
+    def __iter__(self) -> Iterator:
+        yield from self._values
+        yield from self._factories
+
+    def __len__(self) -> int:
+        return len(self._values) + len(self._factories)
+
+    def __repr__(self) -> str:
+        lazy = ", ".join(repr(key) for key in self._factories)
+        return f"{type(self).__name__}({self._values!r}, lazy=[{lazy}])"
+
+    def copy(self) -> "LazyImports":
+        return type(self)(self._values, self._factories)
+
+
+def _lazy_attr(module_name: str, attr_name: str):
+    """Return a factory importing attr_name from module_name when called."""
+    def factory():
+        return getattr(importlib.import_module(module_name), attr_name)
+    return factory
+
+
+def get_core_imports(verbose: bool = False) -> dict:
+    """
+    Get the lightweight project imports and configuration for notebooks.
+
+    Args:
+        verbose: Print the resolved paths and settings
     
     Returns:
-        Dictionary with imported modules and configuration
+        Dictionary with configuration, paths and the ArticleLoader class
     """
+    # .env also holds settings read by AppConfig.from_env; exported values win
     from dotenv import load_dotenv, find_dotenv
-    load_dotenv(find_dotenv())
+    load_dotenv(find_dotenv(), override=False)
     
     # Setup environment
     config, project_root = setup_notebook_environment()
@@ -62,23 +139,13 @@ def get_safe_imports():
     # Import project modules
     try:
         from Module_2_LLM_basics.src.loader import ArticleLoader
-        from Module_2_LLM_basics.src.retriever import ArticleRetriever
     except ImportError as e:
         logging.error(f"Could not import project modules: {e}")
         logging.info("Make sure the project structure is correct and modules are in Python path")
         raise
     
-    # Import external libraries
-    from langchain_chroma import Chroma
     import glob
-    from langchain_openai import ChatOpenAI, OpenAIEmbeddings
-    from langgraph.checkpoint.memory import MemorySaver
-    from langgraph.graph import MessagesState, StateGraph, END
-    from langgraph.prebuilt import ToolNode, tools_condition
-    from langchain_core.tools import tool, render_text_description_and_args
-    from langchain_core.messages import SystemMessage
     from uuid import uuid4
-    from IPython.display import display, Markdown
     
     # Configure paths and models
     if config:
@@ -93,45 +160,89 @@ def get_safe_imports():
         embedding_model_name = "text-embedding-3-small"
         default_k = 5
     
-    # Initialize models
-    llm = ChatOpenAI(model='gpt-4o-mini')
-    embeddings_model = OpenAIEmbeddings(model=embedding_model_name)
-    
-    # Print status information
-    print(f"OpenAI API Key Loaded: {'OPENAI_API_KEY' in os.environ and bool(os.environ.get('OPENAI_API_KEY'))}")
-    print(f"LLM Model Name: {llm.model_name}")
-    print(f"Embeddings Model Name: {embeddings_model.model}")
-    print(f"Using persist directory: {persist_directory}")
-    print(f"Using JSON data directory: {json_dir}")
-    print(f"Default retrieval k: {default_k}")
+    if verbose:
+        print(f"OpenAI API Key Loaded: {bool(os.environ.get('OPENAI_API_KEY'))}")
+        print(f"Using persist directory: {persist_directory}")
+        print(f"Using JSON data directory: {json_dir}")
+        print(f"Default retrieval k: {default_k}")
     
     return {
         'config': config,
         'project_root': project_root,
         'ArticleLoader': ArticleLoader,
-        'ArticleRetriever': ArticleRetriever,
-        'Chroma': Chroma,
         'glob': glob,
-        'llm': llm,
-        'embeddings_model': embeddings_model,
         'persist_directory': persist_directory,
         'json_dir': json_dir,
+        'embedding_model_name': embedding_model_name,
         'default_k': default_k,
-        'MemorySaver': MemorySaver,
-        'MessagesState': MessagesState,
-        'StateGraph': StateGraph,
-        'END': END,
-        'ToolNode': ToolNode,
-        'tools_condition': tools_condition,
-        'tool': tool,
-        'render_text_description_and_args': render_text_description_and_args,
-        'SystemMessage': SystemMessage,
-        'uuid4': uuid4,
-        'display': display,
-        'Markdown': Markdown
+        'uuid4': uuid4
     }
 
+
+def get_llm_imports(embedding_model_name: str = "text-embedding-3-small", verbose: bool = False) -> LazyImports:
+    """
+    Get the LLM, vector store and graph imports for notebooks.
+
+    Nothing heavy is imported here: every entry is resolved on first access,
+    and the OpenAI chat and embedding clients are only created when used.
+
+    Args:
+        embedding_model_name: OpenAI embedding model to use
+        verbose: Print the model names
+    
+    Returns:
+        LazyImports with the LLM-related classes, functions and models
+    """
+    def make_llm():
+        from langchain_openai import ChatOpenAI
+        return ChatOpenAI(model=LLM_MODEL_NAME)
+
+    def make_embeddings_model():
+        from langchain_openai import OpenAIEmbeddings
+        return OpenAIEmbeddings(model=embedding_model_name)
+
+    if verbose:
+        print(f"LLM Model Name: {LLM_MODEL_NAME}")
+        print(f"Embeddings Model Name: {embedding_model_name}")
+    
+    return LazyImports(factories={
+        'ArticleRetriever': _lazy_attr('Module_2_LLM_basics.src.retriever', 'ArticleRetriever'),
+        'Chroma': _lazy_attr('langchain_chroma', 'Chroma'),
+        'llm': make_llm,
+        'embeddings_model': make_embeddings_model,
+        'MemorySaver': _lazy_attr('langgraph.checkpoint.memory', 'MemorySaver'),
+        'MessagesState': _lazy_attr('langgraph.graph', 'MessagesState'),
+        'StateGraph': _lazy_attr('langgraph.graph', 'StateGraph'),
+        'END': _lazy_attr('langgraph.graph', 'END'),
+        'ToolNode': _lazy_attr('langgraph.prebuilt', 'ToolNode'),
+        'tools_condition': _lazy_attr('langgraph.prebuilt', 'tools_condition'),
+        'tool': _lazy_attr('langchain_core.tools', 'tool'),
+        'render_text_description_and_args': _lazy_attr('langchain_core.tools', 'render_text_description_and_args'),
+        'SystemMessage': _lazy_attr('langchain_core.messages', 'SystemMessage'),
+        'display': _lazy_attr('IPython.display', 'display'),
+        'Markdown': _lazy_attr('IPython.display', 'Markdown')
+    })
+
+
+def get_safe_imports(verbose: bool = False) -> LazyImports:
+    """
+    Get safe import statements for notebooks.
+
+    Project configuration is loaded immediately; LLM libraries and models
+    are imported and created on first access (see get_llm_imports).
+
+    Args:
+        verbose: Print the resolved settings and model names
+    
+    Returns:
+        Dictionary with imported modules and configuration
+    """
+    core = get_core_imports(verbose=verbose)
+    imports = get_llm_imports(core['embedding_model_name'], verbose=verbose)
+    imports.update(core)
+    return imports
+
 # Convenience function for quick setup
-def quick_setup():
+def quick_setup(verbose: bool = False):
     """Quick setup function for notebooks."""
-    return get_safe_imports()
\ No newline at end of file
+    return get_safe_imports(verbose=verbose)
\ No newline at end of file
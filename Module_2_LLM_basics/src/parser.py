@@ -1,11 +1,58 @@
+import functools
+import hashlib
+import itertools
 import json
 import logging
+import mmap
+import os
+import pickle
+import re
+import tempfile
+from collections import OrderedDict, defaultdict
+from concurrent.futures import ProcessPoolExecutor
 from enum import StrEnum
 from pathlib import Path
-from typing import TypedDict, List, Dict, Type, Union
+from typing import TypedDict, Iterable, Iterator, List, Dict, Optional, Tuple, Union
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import ijson
+except ImportError:
+    ijson = None
 
 logger = logging.getLogger(__name__)
 
+# orjson parses bytes directly in C; the stdlib parser is the fallback
+_json_loads = orjson.loads if orjson is not None else json.loads
+
+# Page number: digits after the last underscore, before the extension(s);
+# a name without an underscore must be all digits, optionally with .json
+_PAGE_NUMBER_RE = re.compile(r"_(\d+)(?:\.[^_]*)?\Z|\A(\d+)(?:\.json)?\Z", re.ASCII)
+
+# Page files at least this large are memory-mapped and parsed in place
+# instead of being copied into a bytes object first (orjson only)
+MMAP_MIN_SIZE = 1 << 20
+
+# Page files at least this large are streamed box by box with ijson, when
+# installed, instead of being loaded whole
+STREAM_MIN_SIZE = 16 << 20
+
+# Bump when the processed page format changes to invalidate cached pages
+PAGE_CACHE_VERSION = 1
+
+# Number of articles kept by process_article_cached
+ARTICLE_CACHE_SIZE = 128
+
+# Below this many pages the process pool start-up costs more than it saves
+PARALLEL_PAGES_THRESHOLD = 4
+
+# Author, title and abstract are only looked for on the leading pages
+METADATA_MAX_PAGES = 3
+
 
 class Labels(StrEnum):
     ABSTRACT = "abstract"
@@ -23,6 +70,12 @@ class Labels(StrEnum):
     DATE = "date"
 
 
+# Labels collected into the article-level metadata, in metadata key order
+META_LABELS = (Labels.AUTHOR, Labels.TITLE, Labels.ABSTRACT)
+# Hashed membership test for the per-item check
+_META_LABEL_SET = frozenset(META_LABELS)
+
+
 class PageBlock(TypedDict):
     text: str
     label: Labels
@@ -31,6 +84,11 @@ class PageBlock(TypedDict):
 def read_page_data(path: Path) -> List[Dict]:
     """
     Read and parse JSON data from a page file.
+
+    The file is read as bytes and parsed with orjson when it is installed,
+    falling back to the standard json module otherwise. With orjson, files
+    of MMAP_MIN_SIZE bytes or more are memory-mapped and parsed directly
+    from the mapping.
     
     Args:
         path: Path to the JSON file
@@ -40,14 +98,20 @@ def read_page_data(path: Path) -> List[Dict]:
         
     Raises:
         FileNotFoundError: If the file doesn't exist
-        json.JSONDecodeError: If the file contains invalid JSON
+        json.JSONDecodeError: If the file contains invalid JSON (orjson's
+            JSONDecodeError is a subclass of it)
         PermissionError: If the file can't be read due to permissions
     """
     try:
-        with Path(path).open(encoding='utf-8') as f:
-            data = json.load(f)
-            logger.debug(f"Successfully read page data from {path}")
-            return data
+        with open(path, "rb") as f:
+            if orjson is not None and os.fstat(f.fileno()).st_size >= MMAP_MIN_SIZE:
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped, \
+                        memoryview(mapped) as view:
+                    data = orjson.loads(view)
+            else:
+                data = _json_loads(f.read())
+        logger.debug(f"Successfully read page data from {path}")
+        return data
     except FileNotFoundError:
         logger.error(f"File not found: {path}")
         raise
@@ -62,12 +126,38 @@ def read_page_data(path: Path) -> List[Dict]:
         raise
 
 
-def get_page_number(page_path: Path) -> int:
+def iter_page_data(path: Path) -> Iterator[Dict]:
+    """
+    Iterate over the boxes of a page file.
+
+    Files of STREAM_MIN_SIZE bytes or more are parsed incrementally with
+    ijson when it is installed, so only one box is held in memory at a
+    time. Other files are loaded with read_page_data.
+    
+    Args:
+        path: Path to the JSON file
+        
+    Yields:
+        Dictionaries containing page data
+    """
+    if ijson is not None and os.stat(path).st_size >= STREAM_MIN_SIZE:
+        with open(path, "rb") as f:
+            yield from ijson.items(f, "item")
+    else:
+        yield from read_page_data(path)
+
+
+def get_page_number(page_path: Union[Path, str]) -> int:
     """
     Extract page number from file path.
+
+    Only the file name is used: the digits after the last underscore and
+    before the extension, e.g. 3 for "1401.0001_3.json". A name without an
+    underscore is only accepted when it is a bare number, e.g. 3 for
+    "3.json"; "1401.0001.json" is rejected.
     
     Args:
-        page_path: Path object for the page file
+        page_path: Path object or file name of the page file
         
     Returns:
         Page number as integer
@@ -75,16 +165,43 @@ def get_page_number(page_path: Path) -> int:
     Raises:
         ValueError: If page number cannot be extracted from filename
     """
-    try:
-        return int(page_path.stem.split("_")[-1])
-    except (ValueError, IndexError) as e:
-        logger.error(f"Cannot extract page number from filename: {page_path.name}")
-        raise ValueError(f"Invalid filename format for page number extraction: {page_path.name}") from e
+    file_name = page_path if isinstance(page_path, str) else page_path.name
+    match = _PAGE_NUMBER_RE.search(file_name)
+    if match is None:
+        logger.error(f"Cannot extract page number from filename: {file_name}")
+        raise ValueError(f"Invalid filename format for page number extraction: {file_name}")
+    return int(match.group(1) or match.group(2))
+
+
+def _iter_json_files(root: Path) -> Iterator[os.DirEntry]:
+    """
+    Recursively yield the .json file entries below root using os.scandir.
+
+    Directory symlinks are not followed, which also rules out symlink loops.
+
+    Args:
+        root: Directory to walk
+
+    Yields:
+        os.DirEntry objects for JSON files
+    """
+    stack = [root]
+    while stack:
+        with os.scandir(stack.pop()) as entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    stack.append(entry.path)
+                elif entry.name.endswith(".json"):
+                    yield entry
 
 
 def collect_article_pages_paths(directory_path: Path) -> List[Path]:
     """
     Collect and sort all JSON page files from directory.
+
+    The directory tree is walked with os.scandir (see _iter_json_files) and
+    the page number is parsed once per file; Path objects are only built
+    for the sorted result.
     
     Args:
         directory_path: Path to directory containing JSON files
@@ -101,255 +218,550 @@ def collect_article_pages_paths(directory_path: Path) -> List[Path]:
     if not directory_path.is_dir():
         raise ValueError(f"Path is not a directory: {directory_path}")
     
-    json_files = list(directory_path.glob("**/*.json"))
-    if not json_files:
-        logger.warning(f"No JSON files found in directory: {directory_path}")
-        return []
-    
     try:
-        sorted_files = sorted(json_files, key=get_page_number)
-        logger.info(f"Found {len(sorted_files)} JSON files in {directory_path}")
-        return sorted_files
+        numbered_files = [
+            (get_page_number(entry.name), entry.path) for entry in _iter_json_files(directory_path)
+        ]
     except ValueError as e:
         logger.error(f"Error sorting files by page number: {str(e)}")
         raise
 
+    if not numbered_files:
+        logger.warning(f"No JSON files found in directory: {directory_path}")
+        return []
 
-class IParser:
-    """Base interface for parsers."""
-    state: Labels = None
+    numbered_files.sort()
+    logger.info(f"Found {len(numbered_files)} JSON files in {directory_path}")
+    return [Path(path) for _, path in numbered_files]
 
-    @classmethod
-    def get_next_parser(cls, label: Labels) -> Type['IParser']:
-        """Get the appropriate parser for the given label."""
-        raise NotImplementedError
 
-    @classmethod
-    def process(cls, page: List[Dict], text: str, label: Labels, previous_state: Type['IParser']) -> None:
-        """Process text with the given label."""
-        assert cls.state is not None
+# Label behaviors for the page state machine:
+# (separator used when a foreign label joins the run, is_ignored, sticky_labels).
+# sticky_labels are the foreign labels that keep the current state; None
+# means every label does.
+DEFAULT_BEHAVIOR = (" ", False, frozenset())
+IGNORE = (" ", True, frozenset())
 
+# Labels whose text is dropped from the page. The state machine tables are
+# built from this at import time; ParserConfig.ignored_labels is not read.
+IGNORED_LABELS = frozenset({Labels.EQUATION, Labels.FIGURE})
 
-class ParserRegistry:
-    """Registry for managing parser instances."""
-    
-    def __init__(self):
-        self._parsers: Dict[Labels, Type[IParser]] = {}
-        self._default_parsers: Dict[Labels, Type[IParser]] = {}
-        
-    def register_parser(self, label: Labels, parser_class: Type[IParser]) -> None:
-        """Register a custom parser for a label."""
-        self._parsers[label] = parser_class
-        
-    def get_parser(self, label: Labels) -> Type[IParser]:
-        """Get parser for a label, creating default if needed."""
-        if label in self._parsers:
-            return self._parsers[label]
-        
-        if label not in self._default_parsers:
-            self._default_parsers[label] = self._create_default_parser(label)
-            
-        return self._default_parsers[label]
-    
-    def _create_default_parser(self, label: Labels) -> Type[IParser]:
-        """Create a default parser for a label."""
-        class DefaultParserInstance(DefaultParser):
-            state = label
-        return DefaultParserInstance
+BEHAVIOR: Dict[Labels, tuple] = {
+    Labels.AUTHOR: (" ", False, frozenset({Labels.PARAGRAPH, Labels.AUTHOR})),
+    Labels.FOOTER: ("\n", False, None),
+    **{label: IGNORE for label in IGNORED_LABELS},
+}
 
 
-# Global parser registry instance
-parser_registry = ParserRegistry()
+# Integer ids used by the state machine instead of label strings. Labels
+# missing from the enum get an id on first sight (see _register_label).
+LABEL_NAMES: List[str] = list(Labels)
+LABEL_ID: Dict[str, int] = {label.value: i for i, label in enumerate(Labels)}
 
 
-class DefaultParser(IParser):
-    state: Labels = None
+def _behavior_by_id(label: str) -> tuple:
+    """Translate a BEHAVIOR entry into (separator, is_ignored, sticky_mask)."""
+    separator, is_ignored, sticky_labels = BEHAVIOR.get(label, DEFAULT_BEHAVIOR)
+    if sticky_labels is None:
+        # All bits set: every label keeps the state
+        return separator, is_ignored, -1
+    return separator, is_ignored, sum(1 << LABEL_ID[sticky] for sticky in sticky_labels)
 
-    @classmethod
-    def get_next_parser(cls, label: Labels) -> Type[IParser]:
-        if label != cls.state:
-            return parser_registry.get_parser(label)
-        return cls
 
-    @classmethod
-    def _process_text(cls, old_text: str, new_text: str, label: Labels) -> str:
-        """Combine old and new text."""
-        return f"{old_text} {new_text}".strip()
+_BEHAVIOR_BY_ID: List[tuple] = [_behavior_by_id(label) for label in LABEL_NAMES]
 
-    @classmethod
-    def process(cls, page: List[Dict], text: str, label: Labels, previous_state: Type[IParser]) -> None:
-        assert cls.state is not None
 
-        if not page or page[-1]["label"] != cls.state or issubclass(previous_state, IgnoredParser):
-            page.append({"label": cls.state, "text": ''})
+def _next_state(state_id: int, label_id: int) -> int:
+    """State reached from state_id when a box with label_id arrives."""
+    if label_id == state_id or (_BEHAVIOR_BY_ID[state_id][2] >> label_id) & 1:
+        return state_id
+    return label_id
 
-        page[-1]["text"] = cls._process_text(page[-1]["text"], text, label)
 
+# _TRANSITIONS[state_id][label_id] is the next state, precomputed for every pair
+_TRANSITIONS: List[List[int]] = [
+    [_next_state(state_id, label_id) for label_id in range(len(LABEL_NAMES))]
+    for state_id in range(len(LABEL_NAMES))
+]
 
-class AuthorParser(DefaultParser):
-    state = Labels.AUTHOR
 
-    @classmethod
-    def get_next_parser(cls, label: Labels) -> Type[IParser]:
-        if label in (Labels.PARAGRAPH, Labels.AUTHOR):
-            return cls
-        return super().get_next_parser(label)
+def _register_label(label: str) -> int:
+    """Assign an id with the default behavior to a label that is not in Labels."""
+    label_id = len(LABEL_NAMES)
+    LABEL_NAMES.append(label)
+    LABEL_ID[label] = label_id
+    _BEHAVIOR_BY_ID.append(_behavior_by_id(label))
 
+    # Extend the existing rows in place so rows held by callers stay valid
+    for state_id, row in enumerate(_TRANSITIONS):
+        row.append(_next_state(state_id, label_id))
+    _TRANSITIONS.append([_next_state(label_id, other_id) for other_id in range(len(LABEL_NAMES))])
+    return label_id
 
-class FooterParser(DefaultParser):
-    state = Labels.FOOTER
 
-    @classmethod
-    def get_next_parser(cls, label: Labels) -> Type[IParser]:
-        return cls
+def process_page_data(page_data: Iterable[PageBlock]) -> List[Dict]:
+    """
+    Process page data with the table-driven label state machine.
 
-    @classmethod
-    def _process_text(cls, old_text: str, new_text: str, label: Labels) -> str:
-        if cls.state == label:
-            return super()._process_text(old_text, new_text, label)
-        return f"{old_text}\n{new_text}".strip()
+    Consecutive boxes belonging to the same state are merged into a single
+    item; their texts are collected in a list and joined once per item.
+    Ignored labels (see BEHAVIOR) drop their text and break the
+    current run. Labels are handled as integer ids and each box costs one
+    lookup in the precomputed _TRANSITIONS table.
+    
+    Args:
+        page_data: Iterable of page blocks with text and labels
+        
+    Returns:
+        List of processed page items
+    """
+    # Module tables bound to locals to skip a global lookup per box;
+    # _register_label extends the same objects, so the bindings stay valid
+    get_label_id = LABEL_ID.get
+    behaviors = _BEHAVIOR_BY_ID
+    transitions = _TRANSITIONS
+    label_names = LABEL_NAMES
+
+    state = get_label_id(Labels.PARAGRAPH)
+    separator, is_ignored, _ = behaviors[state]
+    next_states = transitions[state]
+    parts_state = -1
+    parts = None
+    page = []
 
+    # The try block is free on Python 3.11+, so malformed boxes are still
+    # skipped one by one without slowing down well-formed ones
+    for box in page_data:
+        try:
+            was_ignored = is_ignored
+            label_id = get_label_id(box["label"])
+            if label_id is None:
+                label_id = _register_label(box["label"])
+
+            next_state = next_states[label_id]
+            if next_state != state:
+                state = next_state
+                separator, is_ignored, _ = behaviors[state]
+                next_states = transitions[state]
+
+            text = box["text"]
+            if is_ignored:
+                continue
+
+            if parts_state != state or was_ignored:
+                parts = []
+                parts_state = state
+                page.append({"label": label_names[state], "parts": parts})
+
+            # Trailing whitespace and blank boxes never survive the final strip;
+            # non-string texts are kept as their str() form
+            text = str(text).rstrip()
+            if text:
+                parts += (" " if label_id == state else separator, text)
+        except Exception as e:
+            logger.error(f"Error processing box with label {box['label']}: {str(e)}")
+            # Continue processing other boxes
+            continue
 
-class IgnoredParser(DefaultParser):
-    """Parser that ignores content."""
-    
-    @classmethod
-    def process(cls, page: List[Dict], text: str, label: Labels, previous_state: Type[IParser]) -> None:
-        pass
+    for item in page:
+        item["text"] = "".join(item.pop("parts")).strip()
 
+    return page
 
-class EquationParser(IgnoredParser):
-    state = Labels.EQUATION
 
+def _page_cache_file(page_path: Path, cache_dir: Path) -> Path:
+    """
+    Locate the cache entry for a page file.
 
-class FigureParser(IgnoredParser):
-    state = Labels.FIGURE
+    The key covers the resolved path, modification time, size and
+    PAGE_CACHE_VERSION, so edited pages and parser changes miss the cache.
 
+    Args:
+        page_path: Path to the page JSON file
+        cache_dir: Directory holding cached pages
 
-# Register custom parsers
-parser_registry.register_parser(Labels.AUTHOR, AuthorParser)
-parser_registry.register_parser(Labels.FOOTER, FooterParser)
-parser_registry.register_parser(Labels.EQUATION, EquationParser)
-parser_registry.register_parser(Labels.FIGURE, FigureParser)
+    Returns:
+        Path of the pickle file for this page
+    """
+    stat = os.stat(page_path)
+    key = f"{PAGE_CACHE_VERSION}:{Path(page_path).resolve()}:{stat.st_mtime_ns}:{stat.st_size}"
+    return Path(cache_dir).expanduser() / f"{hashlib.blake2b(key.encode(), digest_size=16).hexdigest()}.pickle"
 
 
-def process_page_data(page_data: List[PageBlock]) -> List[Dict]:
+def load_processed_page(page_path: Path, cache_dir: Optional[Path] = None) -> List[Dict]:
     """
-    Process page data using appropriate parsers.
-    
+    Read and process a page file, reusing a cached result when available.
+
+    Without cache_dir this is process_page_data(iter_page_data(page_path)).
+    With it, the processed page is pickled into cache_dir on the first call
+    and loaded from there until the page file changes. Only point cache_dir
+    at a trusted directory: cache entries are unpickled.
+
     Args:
-        page_data: List of page blocks with text and labels
-        
+        page_path: Path to the page JSON file
+        cache_dir: Directory for cached pages, e.g. ~/.cache/docbank_pages
+            (a leading ~ is expanded)
+
     Returns:
         List of processed page items
     """
-    state = parser_registry.get_parser(Labels.PARAGRAPH)
-    page = []
+    if cache_dir is None:
+        return process_page_data(iter_page_data(page_path))
 
-    for box in page_data:
+    cache_file = _page_cache_file(page_path, cache_dir)
+    try:
+        page = pickle.loads(cache_file.read_bytes())
+        logger.debug(f"Loaded cached page data for {page_path}")
+        return page
+    except FileNotFoundError:
+        pass
+    except Exception as e:
+        logger.warning(f"Ignoring unreadable page cache {cache_file}: {str(e)}")
+
+    page = process_page_data(iter_page_data(page_path))
+
+    try:
+        cache_file.parent.mkdir(parents=True, exist_ok=True)
+        # Write to a temporary file first so readers never see a partial entry
+        fd, tmp_path = tempfile.mkstemp(dir=cache_file.parent, suffix=".tmp")
         try:
-            previous_state = state
-            state = state.get_next_parser(box["label"])
-            state.process(page, box["text"], box["label"], previous_state)
-        except Exception as e:
-            logger.error(f"Error processing box with label {box['label']}: {str(e)}")
-            # Continue processing other boxes
-            continue
+            with os.fdopen(fd, "wb") as f:
+                pickle.dump(page, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_path, cache_file)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+    except Exception as e:
+        # A failed cache write must never lose a page that parsed fine
+        logger.warning(f"Could not write page cache {cache_file}: {str(e)}")
 
     return page
 
 
-def process_pages(pages_paths: List[Path]) -> List[tuple]:
+def _parse_one(page_path: Path, cache_dir: Optional[Path] = None) -> Optional[tuple]:
+    """
+    Read and process a single page file.
+
+    Defined at module level so it can be pickled for worker processes.
+
+    Args:
+        page_path: Path to the page JSON file
+        cache_dir: Optional directory for cached pages (see load_processed_page)
+
+    Returns:
+        Tuple (page_number, processed_page_data), or None if the page failed
+    """
+    try:
+        return get_page_number(page_path), load_processed_page(page_path, cache_dir)
+    except Exception as e:
+        logger.error(f"Error processing page {page_path}: {str(e)}")
+        return None
+
+
+def _is_page_cached(page_path: Path, cache_dir: Path) -> bool:
+    """Whether load_processed_page has a cache entry for the page as it is now."""
+    try:
+        return _page_cache_file(page_path, cache_dir).exists()
+    except OSError:
+        return False
+
+
+def _prefetch_pages(pages_paths: List[Path]) -> None:
+    """
+    Ask the kernel to start reading all page files before they are parsed.
+
+    Queues readahead for every file up front with posix_fadvise(WILLNEED),
+    so on a cold cache the reads run concurrently instead of one blocking
+    read per page. Does nothing on platforms without posix_fadvise.
+
+    Args:
+        pages_paths: List of paths to page JSON files
+    """
+    if not hasattr(os, "posix_fadvise"):
+        return
+
+    for page_path in pages_paths:
+        try:
+            fd = os.open(page_path, os.O_RDONLY)
+        except OSError:
+            # Reported properly when the page is read
+            continue
+        try:
+            os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_WILLNEED)
+        except OSError:
+            pass
+        finally:
+            os.close(fd)
+
+
+def _iter_pages(
+    pages_paths: List[Path],
+    workers: Optional[int] = 1,
+    cache_dir: Optional[Path] = None
+) -> Iterator[tuple]:
+    """
+    Lazily process pages, yielding them in page order as they are parsed.
+
+    Pages are parsed serially after prefetching the files that are not
+    already in cache_dir (see _prefetch_pages). With workers above 1 and at least
+    PARALLEL_PAGES_THRESHOLD pages, they are parsed in a process pool
+    instead; this only pays off for large pages, since a typical page
+    parses in well under a millisecond and the pool is started on every
+    call. Pages that fail to process are logged and skipped.
+
+    Args:
+        pages_paths: List of paths to page JSON files
+        workers: Number of worker processes. 1 (the default) disables the
+            process pool, None uses os.cpu_count().
+        cache_dir: Optional directory for cached pages (see load_processed_page)
+
+    Yields:
+        Tuples (page_number, processed_page_data)
+    """
+    if workers is None:
+        workers = os.cpu_count() or 1
+
+    parse_one = functools.partial(_parse_one, cache_dir=cache_dir)
+
+    if workers > 1 and len(pages_paths) >= PARALLEL_PAGES_THRESHOLD:
+        # About four chunks per worker: few round-trips, still balanced
+        chunksize = max(1, len(pages_paths) // (4 * workers))
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            for result in executor.map(parse_one, pages_paths, chunksize=chunksize):
+                if result is not None:
+                    yield result
+    else:
+        # Pool workers already overlap their reads; a single process prefetches
+        # the pages it will actually read, i.e. those missing from the cache
+        if cache_dir is not None:
+            _prefetch_pages([p for p in pages_paths if not _is_page_cached(p, cache_dir)])
+        else:
+            _prefetch_pages(pages_paths)
+        for page_path in pages_paths:
+            result = parse_one(page_path)
+            if result is not None:
+                yield result
+
+
+def process_pages(
+    pages_paths: List[Path],
+    workers: Optional[int] = 1,
+    cache_dir: Optional[Path] = None
+) -> List[tuple]:
     """
     Process multiple pages from file paths.
     
     Args:
         pages_paths: List of paths to page JSON files
+        workers: Number of worker processes (see _iter_pages)
+        cache_dir: Optional directory for cached pages (see load_processed_page)
         
     Returns:
         List of tuples (page_number, processed_page_data)
     """
-    pages = []
-
-    for page_path in pages_paths:
-        try:
-            page_data = read_page_data(page_path)
-            page_number = get_page_number(page_path)
-            page = process_page_data(page_data)
-            pages.append((page_number, page))
-        except Exception as e:
-            logger.error(f"Error processing page {page_path}: {str(e)}")
-            # Continue with other pages
-            continue
+    pages = list(_iter_pages(pages_paths, workers=workers, cache_dir=cache_dir))
 
     logger.info(f"Successfully processed {len(pages)} out of {len(pages_paths)} pages")
     return pages
 
 
-def process_article(article_directory_path: Path, min_length: int = 20) -> List[Dict]:
+def _split_page(page: List[Dict], min_length: int) -> Tuple[List[str], List[Tuple[Labels, str]]]:
+    """
+    Split a processed page into its content paragraphs and metadata items in one walk.
+
+    Args:
+        page: Processed page items
+        min_length: Minimum length for paragraph content to be included
+
+    Returns:
+        Tuple (paragraphs, meta_items) of stripped paragraph texts longer than
+        min_length and (label, text) pairs for metadata labels
+    """
+    paragraph_label = Labels.PARAGRAPH
+    paragraphs = []
+    meta_items = []
+
+    for item in page:
+        label = item["label"]
+        if label == paragraph_label:
+            text = item["text"].strip()
+            if len(text) > min_length:
+                paragraphs.append(text)
+        elif label in _META_LABEL_SET:
+            meta_items.append((label, item["text"]))
+
+    return paragraphs, meta_items
+
+
+def _extract_metadata(
+    pages_iter: Iterator[tuple],
+    early_stop: int = METADATA_MAX_PAGES
+) -> Tuple[Dict[Labels, List[str]], Iterator[tuple]]:
+    """
+    Collect author, title and abstract texts from the first pages of an article.
+
+    At most early_stop pages are scanned, and the scan ends earlier once all
+    metadata labels have been found and a page without any of them follows.
+    Scanned pages are chained back in front of the remaining ones.
+
+    Args:
+        pages_iter: Iterator of (page_number, paragraphs, meta_items) tuples
+            as produced by _split_page
+        early_stop: Maximum number of pages to scan for metadata
+
+    Returns:
+        Tuple (raw_meta, pages) where raw_meta maps labels to their texts and
+        pages yields every page from pages_iter, scanned ones included
+    """
+    raw_meta: Dict[Labels, List[str]] = defaultdict(list)
+    scanned = []
+
+    for page in pages_iter:
+        scanned.append(page)
+        meta_items = page[2]
+
+        for label, text in meta_items:
+            raw_meta[label].append(text)
+
+        if len(scanned) >= early_stop or (not meta_items and len(raw_meta) == len(META_LABELS)):
+            break
+
+    return raw_meta, itertools.chain(scanned, pages_iter)
+
+
+def process_article(
+    article_directory_path: Path,
+    min_length: int = 20,
+    workers: Optional[int] = 1,
+    cache_dir: Optional[Path] = None
+) -> Iterator[Dict]:
     """
     Process an entire article from directory containing JSON page files.
+
+    Content blocks are yielded as pages are parsed; only the leading pages
+    scanned for metadata (see _extract_metadata) are buffered.
+
+    Author, title and abstract metadata is collected from at most the first
+    METADATA_MAX_PAGES pages (see _extract_metadata); those labels are
+    ignored on later pages.
+
+    This is a generator: nothing is read until it is first iterated, so
+    the exceptions below are raised by the first next(), not by the call.
     
     Args:
         article_directory_path: Path to directory with article JSON files
         min_length: Minimum length for paragraph content to be included
+        workers: Number of worker processes used to parse pages (see _iter_pages)
+        cache_dir: Optional directory for cached pages (see load_processed_page)
         
-    Returns:
-        List of dictionaries with page_content and metadata
+    Yields:
+        Dictionaries with page_content and metadata
         
     Raises:
-        FileNotFoundError: If directory doesn't exist
-        ValueError: If directory is invalid or contains no processable files
+        FileNotFoundError: On first iteration, if directory doesn't exist
+        ValueError: On first iteration, if directory is invalid or contains
+            no processable files
     """
     if not isinstance(article_directory_path, Path):
         article_directory_path = Path(article_directory_path)
-        
-    result = []
     
     try:
         pages_paths = collect_article_pages_paths(article_directory_path)
         if not pages_paths:
             logger.warning(f"No JSON files found in {article_directory_path}")
-            return result
-            
-        pages = process_pages(pages_paths)
-        if not pages:
-            logger.warning(f"No pages could be processed from {article_directory_path}")
-            return result
+            return
 
-        # Extract metadata from all pages
-        meta_labels = {Labels.AUTHOR, Labels.TITLE, Labels.ABSTRACT}
-        raw_meta: Dict[Labels, List[str]] = {}
-        
-        for page_number, page in pages:
-            for item in page:
-                if item["label"] in meta_labels:
-                    if item["label"] not in raw_meta:
-                        raw_meta[item["label"]] = []
-                    raw_meta[item["label"]].append(item["text"])
+        # Each page is walked once: paragraphs and metadata are split together
+        pages = (
+            (page_number, *_split_page(page, min_length))
+            for page_number, page in _iter_pages(pages_paths, workers=workers, cache_dir=cache_dir)
+        )
+        raw_meta, pages = _extract_metadata(pages)
 
+        # Joined once per article; "page" is added per page below
         common_metadata = {
             "source": article_directory_path.name,
-            **{label.value: "\n".join(raw_meta.get(label, [])) for label in meta_labels},
-            "page": 0
+            **{label.value: "\n".join(raw_meta.get(label, [])) for label in META_LABELS}
         }
 
-        # Process content from all pages
-        for page_number, page in pages:
-            metadata = common_metadata.copy()
-            metadata["page"] = page_number + 1
+        # Emit content page by page; all blocks of a page share one metadata dict
+        pages_count = 0
+        blocks_count = 0
+        for page_number, paragraphs, _ in pages:
+            pages_count += 1
+            metadata = {**common_metadata, "page": page_number + 1}
             
-            for item in page:
-                if (item["label"] == Labels.PARAGRAPH and 
-                    len(item["text"].strip()) > min_length):
-                    result.append({
-                        "page_content": item["text"].strip(),
-                        "metadata": metadata
-                    })
-
-        logger.info(f"Processed article {article_directory_path.name}: {len(result)} content blocks")
-        return result
+            for text in paragraphs:
+                yield {
+                    "page_content": text,
+                    "metadata": metadata
+                }
+            blocks_count += len(paragraphs)
+
+        if not pages_count:
+            logger.warning(f"No pages could be processed from {article_directory_path}")
+            return
+
+        logger.info(
+            f"Processed article {article_directory_path.name}: {blocks_count} content blocks "
+            f"from {pages_count} out of {len(pages_paths)} pages"
+        )
         
     except Exception as e:
         logger.error(f"Error processing article {article_directory_path}: {str(e)}")
-        raise
\ No newline at end of file
+        raise
+
+
+# Articles materialized by process_article_cached, least recently used first
+_ARTICLE_CACHE: "OrderedDict[tuple, Tuple[Dict, ...]]" = OrderedDict()
+
+
+def process_article_cached(
+    article_directory_path: Path,
+    min_length: int = 20,
+    workers: Optional[int] = 1
+) -> Tuple[Dict, ...]:
+    """
+    Process an article, reusing the result of an earlier call in this process.
+
+    Results are kept in an LRU cache of ARTICLE_CACHE_SIZE articles, keyed by
+    the directory, min_length and the path, mtime and size of every page
+    file, so any change to the pages triggers a fresh parse. workers does
+    not affect the result and is not part of the key. Clear the cache with
+    process_article_cached.cache_clear().
+
+    The returned blocks are shared between calls and must not be modified.
+    
+    Args:
+        article_directory_path: Path to directory with article JSON files
+        min_length: Minimum length for paragraph content to be included
+        workers: Number of worker processes used to parse pages (see _iter_pages)
+        
+    Returns:
+        Tuple of dictionaries with page_content and metadata
+        
+    Raises:
+        FileNotFoundError: If directory doesn't exist
+        ValueError: If directory is invalid or contains no processable files
+    """
+    article_directory_path = Path(article_directory_path)
+    pages_key = []
+    for page_path in collect_article_pages_paths(article_directory_path):
+        stat = page_path.stat()
+        pages_key.append((str(page_path), stat.st_mtime_ns, stat.st_size))
+
+    key = (str(article_directory_path), tuple(pages_key), min_length)
+    try:
+        _ARTICLE_CACHE.move_to_end(key)
+        return _ARTICLE_CACHE[key]
+    except KeyError:
+        pass
+
+    article = tuple(process_article(article_directory_path, min_length=min_length, workers=workers))
+    _ARTICLE_CACHE[key] = article
+    if len(_ARTICLE_CACHE) > ARTICLE_CACHE_SIZE:
+        _ARTICLE_CACHE.popitem(last=False)
+    return article
+
+
+process_article_cached.cache_clear = _ARTICLE_CACHE.clear
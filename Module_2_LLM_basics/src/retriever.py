@@ -1,4 +1,5 @@
 # src/retriever.py
+import functools
 import logging
 from typing import List, Optional, Dict, Any
 from langchain_core.documents import Document
@@ -6,6 +7,9 @@ from langchain_chroma import Chroma
 
 logger = logging.getLogger(__name__)
 
+# Number of distinct query embeddings kept per retriever
+QUERY_EMBEDDING_CACHE_SIZE = 1024
+
 
 class ArticleRetriever:
     """
@@ -15,13 +19,16 @@ class ArticleRetriever:
     relevant documents based on a query and optional filters.
     """
     
-    def __init__(self, vectordb: Chroma, default_k: int = 5):
+    def __init__(self, vectordb: Chroma, default_k: int = 5, warmup_query: Optional[str] = None):
         """
         Initializes the retriever with a Chroma vector database instance.
 
         Args:
             vectordb: An instance of the Chroma vector database.
             default_k: Default number of documents to retrieve.
+            warmup_query: Optional query run once (k=1) during initialization so
+                the index load and the query's embedding happen here rather
+                than on the first user-facing call.
             
         Raises:
             ValueError: If vectordb is None or default_k is not positive.
@@ -33,8 +40,25 @@ class ArticleRetriever:
             
         self.vectordb = vectordb
         self.default_k = default_k
+        # Per-instance cache so repeated queries skip the embedding model
+        self._embed_query = functools.lru_cache(maxsize=QUERY_EMBEDDING_CACHE_SIZE)(self._compute_query_embedding)
         logger.info(f"ArticleRetriever initialized with default_k={default_k}")
 
+        if warmup_query:
+            self._warm_up(warmup_query)
+
+    def _warm_up(self, query: str) -> None:
+        """Runs a throwaway k=1 search; failures are logged and ignored."""
+        try:
+            self.get_relevant_documents(query, k=1)
+            logger.info("ArticleRetriever warm-up query completed")
+        except Exception as e:
+            logger.warning(f"ArticleRetriever warm-up query failed: {str(e)}")
+
+    def _compute_query_embedding(self, query: str) -> List[float]:
+        """Embeds a query with the vector database's embedding function."""
+        return self.vectordb.embeddings.embed_query(query)
+
     def get_relevant_documents(
         self, 
         query: str, 
@@ -44,6 +68,9 @@ class ArticleRetriever:
         """
         Retrieves relevant documents from the vector database.
 
+        Query embeddings are cached per retriever, so repeating a query
+        does not call the embedding model again.
+
         Args:
             query: The search query string.
             k: Number of documents to retrieve. If None, uses default_k.
@@ -68,11 +95,18 @@ class ArticleRetriever:
         try:
             logger.debug(f"Retrieving {k} documents for query: '{query[:50]}...'")
             
-            documents = self.vectordb.similarity_search(
-                query=query.strip(), 
-                k=k, 
-                filter=query_filter
-            )
+            if self.vectordb.embeddings is not None:
+                documents = self.vectordb.similarity_search_by_vector(
+                    embedding=self._embed_query(query.strip()), 
+                    k=k, 
+                    filter=query_filter
+                )
+            else:
+                documents = self.vectordb.similarity_search(
+                    query=query.strip(), 
+                    k=k, 
+                    filter=query_filter
+                )
             
             logger.info(f"Successfully retrieved {len(documents)} documents")
             return documents
@@ -114,11 +148,18 @@ class ArticleRetriever:
         try:
             logger.debug(f"Retrieving {k} documents with scores for query: '{query[:50]}...'")
             
-            documents_with_scores = self.vectordb.similarity_search_with_score(
-                query=query.strip(), 
-                k=k, 
-                filter=query_filter
-            )
+            if self.vectordb.embeddings is not None:
+                documents_with_scores = self.vectordb.similarity_search_by_vector_with_relevance_scores(
+                    embedding=self._embed_query(query.strip()), 
+                    k=k, 
+                    filter=query_filter
+                )
+            else:
+                documents_with_scores = self.vectordb.similarity_search_with_score(
+                    query=query.strip(), 
+                    k=k, 
+                    filter=query_filter
+                )
             
             logger.info(f"Successfully retrieved {len(documents_with_scores)} documents with scores")
             return documents_with_scores
@@ -127,6 +168,84 @@ class ArticleRetriever:
             logger.error(f"Error retrieving documents with scores for query '{query[:50]}...': {str(e)}")
             raise
     
+    def get_relevant_documents_batch(
+        self, 
+        queries: List[str], 
+        k: Optional[int] = None, 
+        query_filter: Optional[Dict[str, Any]] = None
+    ) -> List[List[Document]]:
+        """
+        Retrieves relevant documents for several queries at once.
+
+        All queries are searched with a single Chroma query instead of one
+        round-trip per query. Embedding is not batched: each query not yet
+        in the query embedding cache costs one embed_query call, so N new
+        queries still make N embedding requests. LangChain only batches
+        embed_documents, which some models embed differently from queries;
+        using embed_query keeps the results identical to
+        get_relevant_documents, and cached queries skip the model entirely.
+        Chroma has no public multi-query search, so this goes through the
+        underlying collection like health_check does. Results stored
+        without document text are skipped.
+
+        Args:
+            queries: The search query strings.
+            k: Number of documents to retrieve per query. If None, uses default_k.
+            query_filter: Optional filter applied to every query.
+
+        Returns:
+            A list with one list of Langchain Document objects per query,
+            in the same order as queries.
+            
+        Raises:
+            ValueError: If queries is empty or contains an empty query.
+            Exception: If there's an error during retrieval.
+        """
+        # Validate input parameters
+        if not queries:
+            raise ValueError("Queries cannot be empty or None")
+        if any(not query or not query.strip() for query in queries):
+            raise ValueError("Query cannot be empty or None")
+            
+        if k is None:
+            k = self.default_k
+        elif k <= 0:
+            raise ValueError("k must be a positive integer")
+            
+        stripped_queries = [query.strip() for query in queries]
+        
+        try:
+            logger.debug(f"Retrieving {k} documents for each of {len(queries)} queries")
+            
+            if self.vectordb.embeddings is not None:
+                search_input = {"query_embeddings": [self._embed_query(query) for query in stripped_queries]}
+            else:
+                # Collection embeds the texts itself
+                search_input = {"query_texts": stripped_queries}
+            
+            results = self.vectordb._collection.query(
+                **search_input,
+                n_results=k,
+                where=query_filter,
+                include=["documents", "metadatas"]
+            )
+            
+            documents = [
+                [
+                    Document(page_content=text, metadata=metadata or {}, id=doc_id)
+                    for text, metadata, doc_id in zip(texts, metadatas, ids)
+                    if text is not None
+                ]
+                for texts, metadatas, ids in zip(results["documents"], results["metadatas"], results["ids"])
+            ]
+            
+            logger.info(f"Successfully retrieved documents for {len(documents)} queries")
+            return documents
+            
+        except Exception as e:
+            logger.error(f"Error retrieving documents for {len(queries)} queries: {str(e)}")
+            raise
+    
     def health_check(self) -> bool:
         """
         Performs a basic health check on the vector database.
@@ -0,0 +1,52 @@
+import pytest
+
+from Module_2_LLM_basics.src.notebook_setup import LazyImports
+
+
+def test_lazy_entries_are_listed_without_being_built():
+    calls = []
+    imports = LazyImports({"a": 1}, {"b": lambda: calls.append("b") or 2})
+
+    assert "b" in imports
+    assert list(imports) == ["a", "b"]
+    assert len(imports) == 2
+    assert calls == []
+
+
+def test_lazy_entry_is_built_once():
+    calls = []
+    imports = LazyImports(factories={"b": lambda: calls.append("b") or 2})
+
+    assert imports["b"] == 2
+    assert imports["b"] == 2
+    assert calls == ["b"]
+
+
+def test_copying_into_a_dict_builds_every_entry():
+    imports = LazyImports({"a": 1}, {"b": lambda: 2})
+    namespace = {}
+
+    namespace.update(imports)
+
+    assert namespace == {"a": 1, "b": 2}
+    assert {**imports} == {"a": 1, "b": 2}
+
+
+def test_failed_factory_can_be_retried():
+    attempts = []
+
+    def factory():
+        attempts.append(1)
+        if len(attempts) == 1:
+            raise RuntimeError("OPENAI_API_KEY is not set")
+        return "llm"
+
+    imports = LazyImports(factories={"llm": factory})
+
+    with pytest.raises(RuntimeError):
+        imports["llm"]
+
+    assert "llm" in imports
+    assert len(imports) == 1
+    assert imports["llm"] == "llm"
+    assert len(attempts) == 2
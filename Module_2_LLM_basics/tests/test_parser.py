@@ -0,0 +1,356 @@
+import json
+import pickle
+import random
+
+import pytest
+
+from Module_2_LLM_basics.src import parser
+from Module_2_LLM_basics.src.parser import (
+    Labels,
+    _extract_metadata,
+    _is_page_cached,
+    get_page_number,
+    load_processed_page,
+    process_article,
+    process_article_cached,
+    process_page_data,
+)
+
+
+def box(label, text):
+    return {"label": label, "text": text}
+
+
+def items(page):
+    return [(item["label"], item["text"]) for item in page]
+
+
+def reference_process_page_data(page_data):
+    """
+    Straightforward restatement of the label rules process_page_data implements:
+
+    - a box starts a new item when its label differs from the current state,
+      except that author keeps paragraph and author boxes and footer keeps
+      every box until the end of the page;
+    - texts are joined with a space, or a newline for non-footer boxes
+      inside a footer, and stripped;
+    - equation and figure boxes are dropped and break the current run.
+    """
+    ignored = {Labels.EQUATION, Labels.FIGURE}
+    page = []
+    state = Labels.PARAGRAPH
+    for data in page_data:
+        previous_state = state
+        label = data["label"]
+        if state == Labels.FOOTER:
+            pass
+        elif state == Labels.AUTHOR and label in (Labels.PARAGRAPH, Labels.AUTHOR):
+            pass
+        else:
+            state = label
+        if "text" not in data:
+            continue
+        if state in ignored:
+            continue
+        if not page or page[-1]["label"] != state or previous_state in ignored:
+            page.append({"label": state, "text": ""})
+        separator = "\n" if state == Labels.FOOTER and label != Labels.FOOTER else " "
+        page[-1]["text"] = f"{page[-1]['text']}{separator}{data['text']}".strip()
+    return page
+
+
+def test_consecutive_boxes_with_the_same_label_are_merged():
+    page = process_page_data([
+        box("section", "1"),
+        box("section", "Intro"),
+        box("paragraph", "x"),
+        box("list", "i1"),
+        box("list", "i2"),
+    ])
+
+    assert items(page) == [("section", "1 Intro"), ("paragraph", "x"), ("list", "i1 i2")]
+
+
+def test_footer_keeps_every_following_box():
+    page = process_page_data([
+        box("paragraph", "Body text."),
+        box("footer", "Page 1"),
+        box("paragraph", "more"),
+        box("equation", "x=1"),
+        box("title", "T"),
+    ])
+
+    assert items(page) == [("paragraph", "Body text."), ("footer", "Page 1\nmore\nx=1\nT")]
+
+
+def test_author_keeps_paragraph_and_author_boxes():
+    page = process_page_data([
+        box("author", "Jane Doe"),
+        box("paragraph", "Univ"),
+        box("author", "John Roe"),
+        box("title", "A Title"),
+        box("paragraph", "after"),
+    ])
+
+    assert items(page) == [
+        ("author", "Jane Doe Univ John Roe"),
+        ("title", "A Title"),
+        ("paragraph", "after"),
+    ]
+
+
+def test_ignored_labels_are_dropped_and_split_runs():
+    page = process_page_data([
+        box("paragraph", "first part"),
+        box("equation", "E=mc^2"),
+        box("paragraph", "second part"),
+        box("figure", "fig"),
+        box("figure", "fig2"),
+        box("paragraph", "third"),
+    ])
+
+    assert items(page) == [
+        ("paragraph", "first part"),
+        ("paragraph", "second part"),
+        ("paragraph", "third"),
+    ]
+
+
+def test_unknown_labels_get_the_default_behavior():
+    page = process_page_data([
+        box("paragraph", "a"),
+        box("sidebar", "s1"),
+        box("sidebar", "s2"),
+        box("paragraph", "b"),
+        box("sidebar", "s3"),
+    ])
+
+    assert items(page) == [
+        ("paragraph", "a"),
+        ("sidebar", "s1 s2"),
+        ("paragraph", "b"),
+        ("sidebar", "s3"),
+    ]
+
+
+def test_whitespace_only_boxes_add_nothing():
+    page = process_page_data([
+        box("paragraph", "  a  "),
+        box("paragraph", "   "),
+        box("paragraph", ""),
+        box("paragraph", "\tb\n"),
+        box("section", "  "),
+        box("paragraph", "c"),
+    ])
+
+    assert items(page) == [("paragraph", "a \tb"), ("section", ""), ("paragraph", "c")]
+
+
+def test_malformed_boxes_are_skipped():
+    page = process_page_data([
+        box("paragraph", "a"),
+        {"label": "paragraph"},
+        box("paragraph", 5),
+        box("paragraph", "b"),
+        box("section", None),
+        box("paragraph", "c"),
+    ])
+
+    assert items(page) == [("paragraph", "a 5 b"), ("section", "None"), ("paragraph", "c")]
+
+
+def test_matches_reference_on_random_pages():
+    rng = random.Random(0)
+    labels = [label.value for label in Labels] + ["sidebar", "marginal"]
+    texts = ["word", "Two words", "  padded  ", "", " ", "\t", "line\n", "x"]
+
+    for _ in range(2000):
+        page_data = [
+            box(rng.choice(labels), rng.choice(texts))
+            for _ in range(rng.randint(0, 30))
+        ]
+        assert items(process_page_data(page_data)) == items(reference_process_page_data(page_data))
+
+
+@pytest.mark.parametrize(
+    "file_name, expected",
+    [
+        ("1401.0001_3.json", 3),
+        ("1401.0001_12.json", 12),
+        ("3.json", 3),
+        ("12", 12),
+        ("article_7.tar.json", 7),
+    ],
+)
+def test_get_page_number(file_name, expected):
+    assert get_page_number(file_name) == expected
+
+
+@pytest.mark.parametrize(
+    "file_name",
+    ["abstract.json", "page_.json", "page_-3.json", "page_x.json", "1401.0001.json", "2.5.json", "3.tar.json"],
+)
+def test_get_page_number_rejects_names_without_digits(file_name):
+    with pytest.raises(ValueError):
+        get_page_number(file_name)
+
+
+def write_page(path, boxes):
+    path.write_text(json.dumps(boxes))
+    return path
+
+
+def test_page_cache_is_reused_until_the_page_changes(tmp_path):
+    cache_dir = tmp_path / "cache"
+    page_path = write_page(tmp_path / "article_1.json", [box("paragraph", "first")])
+
+    assert items(load_processed_page(page_path, cache_dir)) == [("paragraph", "first")]
+    assert len(list(cache_dir.iterdir())) == 1
+    assert _is_page_cached(page_path, cache_dir)
+
+    write_page(page_path, [box("paragraph", "edited text")])
+
+    assert not _is_page_cached(page_path, cache_dir)
+    assert items(load_processed_page(page_path, cache_dir)) == [("paragraph", "edited text")]
+    assert len(list(cache_dir.iterdir())) == 2
+
+
+def test_page_cache_misses_after_a_version_bump(tmp_path, monkeypatch):
+    cache_dir = tmp_path / "cache"
+    page_path = write_page(tmp_path / "article_1.json", [box("paragraph", "first")])
+    load_processed_page(page_path, cache_dir)
+
+    monkeypatch.setattr(parser, "PAGE_CACHE_VERSION", parser.PAGE_CACHE_VERSION + 1)
+
+    assert not _is_page_cached(page_path, cache_dir)
+
+
+def test_page_cache_write_failure_keeps_the_page(tmp_path, monkeypatch):
+    cache_dir = tmp_path / "cache"
+    page_path = write_page(tmp_path / "article_1.json", [box("paragraph", "first")])
+
+    def failing_dump(*args, **kwargs):
+        raise pickle.PicklingError("cannot pickle")
+
+    monkeypatch.setattr(parser.pickle, "dump", failing_dump)
+
+    assert items(load_processed_page(page_path, cache_dir)) == [("paragraph", "first")]
+    assert list(cache_dir.iterdir()) == []
+
+
+@pytest.fixture
+def article_dir(tmp_path):
+    process_article_cached.cache_clear()
+    write_page(tmp_path / "article_0.json", [box("paragraph", "page one text")])
+    write_page(tmp_path / "article_1.json", [box("paragraph", "page two text")])
+    yield tmp_path
+    process_article_cached.cache_clear()
+
+
+def contents(article):
+    return [(block["page_content"], block["metadata"]["page"]) for block in article]
+
+
+def test_article_cache_is_shared_across_worker_counts(article_dir):
+    article = process_article_cached(article_dir, min_length=0)
+
+    assert process_article_cached(article_dir, min_length=0, workers=None) is article
+    assert contents(article) == [("page one text", 1), ("page two text", 2)]
+
+
+def test_article_cache_misses_after_a_page_is_edited(article_dir):
+    process_article_cached(article_dir, min_length=0)
+
+    write_page(article_dir / "article_1.json", [box("paragraph", "page two, edited")])
+
+    assert contents(process_article_cached(article_dir, min_length=0)) == [
+        ("page one text", 1),
+        ("page two, edited", 2),
+    ]
+
+
+def test_article_cache_misses_after_a_page_is_added(article_dir):
+    process_article_cached(article_dir, min_length=0)
+
+    write_page(article_dir / "article_2.json", [box("paragraph", "page three text")])
+
+    assert contents(process_article_cached(article_dir, min_length=0)) == [
+        ("page one text", 1),
+        ("page two text", 2),
+        ("page three text", 3),
+    ]
+
+
+def test_article_cache_misses_after_a_page_is_removed(article_dir):
+    process_article_cached(article_dir, min_length=0)
+
+    (article_dir / "article_1.json").unlink()
+
+    assert contents(process_article_cached(article_dir, min_length=0)) == [("page one text", 1)]
+
+
+def test_article_cache_can_be_cleared(article_dir):
+    article = process_article_cached(article_dir, min_length=0)
+
+    process_article_cached.cache_clear()
+
+    assert process_article_cached(article_dir, min_length=0) is not article
+
+
+def write_article(directory, pages):
+    for page_number, boxes in enumerate(pages):
+        write_page(directory / f"article_{page_number}.json", boxes)
+    return directory
+
+
+def metadata(article):
+    first = article[0]["metadata"]
+    return {key: first[key] for key in ("author", "title", "abstract")}
+
+
+def test_metadata_past_the_leading_pages_is_ignored(tmp_path):
+    write_article(tmp_path, [
+        [box("title", "A Title"), box("paragraph", "page one")],
+        [box("paragraph", "page two")],
+        [box("paragraph", "page three")],
+        [box("author", "Late Author"), box("abstract", "Late abstract"), box("paragraph", "page four")],
+    ])
+
+    article = list(process_article(tmp_path, min_length=0))
+
+    assert parser.METADATA_MAX_PAGES == 3
+    assert metadata(article) == {"author": "", "title": "A Title", "abstract": ""}
+    assert [block["metadata"]["page"] for block in article] == [1, 2, 3, 4]
+
+
+def test_metadata_scan_stops_after_a_page_without_metadata(tmp_path):
+    write_article(tmp_path, [
+        [box("title", "A Title"), box("author", "Jane Doe"), box("abstract", "Short abstract")],
+        [box("paragraph", "page two")],
+        [box("paragraph", "page three"), box("author", "Not an author")],
+    ])
+
+    article = list(process_article(tmp_path, min_length=0))
+
+    assert metadata(article) == {"author": "Jane Doe", "title": "A Title", "abstract": "Short abstract"}
+    assert [block["page_content"] for block in article] == ["page two", "page three"]
+
+
+def test_extract_metadata_reads_only_the_scanned_pages():
+    pages = [
+        (0, [], [(Labels.TITLE, "T"), (Labels.AUTHOR, "A"), (Labels.ABSTRACT, "Abs")]),
+        (1, ["p"], []),
+        (2, ["q"], [(Labels.AUTHOR, "B")]),
+    ]
+    pulled = []
+
+    def pages_iter():
+        for page in pages:
+            pulled.append(page[0])
+            yield page
+
+    raw_meta, remaining = _extract_metadata(pages_iter())
+
+    assert pulled == [0, 1]
+    assert dict(raw_meta) == {Labels.TITLE: ["T"], Labels.AUTHOR: ["A"], Labels.ABSTRACT: ["Abs"]}
+    assert list(remaining) == pages